@@ -1,12 +1,15 @@
+from functools import lru_cache, cached_property
+from operator import attrgetter
 from typing import (
     TypeVar,
     Generator,
     Any,
     Generic,
+    Sequence,
 )
 
-from sqlalchemy import select, delete, update
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, delete, update, bindparam
+from sqlalchemy.ext.asyncio import AsyncSession, AsyncScalarResult
 from sqlalchemy.orm import DeclarativeBase
 
 from fabric.exc import NoResultFoundException
@@ -17,49 +20,86 @@ ModelType = TypeVar("ModelType", bound=DeclarativeBase)
 class CRUDBase(Generic[ModelType]):
     def __init__(self, model: type[ModelType]):
         self._model = model
+        self._compiled_select = lru_cache(maxsize=64)(self._build_select)
 
     def _generate_where_clause(
         self, filter_dict: dict[str, Any]
     ) -> Generator[Any, None, None]:
+        columns = attrgetter(*filter_dict)(self._model) if filter_dict else ()
+        if len(filter_dict) == 1:
+            columns = (columns,)
         return (
-            getattr(self._model, field) == value
-            for field, value in filter_dict.items()
+            column == value
+            for column, value in zip(columns, filter_dict.values())
         )
 
-    @property
+    @cached_property
     def _select_model(self):
         return select(self._model)
 
+    def _build_select(self, keys: tuple[tuple[str, bool], ...]):
+        params = {
+            key: None if is_null else bindparam(key) for key, is_null in keys
+        }
+        return self._select_model.where(*self._generate_where_clause(params))
+
+    def _filtered_select(self, filter_dict: dict[str, Any]):
+        if (
+            type(self)._generate_where_clause
+            is not CRUDBase._generate_where_clause
+        ):
+            # overridden clause builders may transform values in Python,
+            # so they can't be fed bind parameters
+            return (
+                self._select_model.where(
+                    *self._generate_where_clause(filter_dict)
+                ),
+                {},
+            )
+        stmt = self._compiled_select(
+            tuple(sorted((k, v is None) for k, v in filter_dict.items()))
+        )
+        return stmt, filter_dict
+
     async def get_multi(
         self,
         session: AsyncSession,
         filter_dict: dict[str, Any],
         offset: int = 0,
         limit: int = None,
-    ) -> list[ModelType]:
-        stmt = self._select_model.where(
-            *self._generate_where_clause(filter_dict)
-        ).offset(offset)
+    ) -> Sequence[ModelType]:
+        stmt, params = self._filtered_select(filter_dict)
+        stmt = stmt.offset(offset)
         if limit is not None:
             stmt = stmt.limit(limit)
-        result = await session.execute(stmt)
-        return list(result.scalars().all())
+        result = await session.execute(stmt, params)
+        return result.scalars().all()
+
+    async def stream_multi(
+        self,
+        session: AsyncSession,
+        filter_dict: dict[str, Any],
+        offset: int = 0,
+        yield_per: int = 500,
+    ) -> AsyncScalarResult[ModelType]:
+        stmt, params = self._filtered_select(filter_dict)
+        stmt = stmt.offset(offset).execution_options(yield_per=yield_per)
+        return await session.stream_scalars(stmt, params)
 
     async def get_one(
         self, session: AsyncSession, filter_dict: dict[str, Any]
     ) -> ModelType:
-        stmt = self._select_model.where(
-            *self._generate_where_clause(filter_dict)
-        )
-        result = await session.execute(stmt)
+        stmt, params = self._filtered_select(filter_dict)
+        result = await session.execute(stmt, params)
         return result.scalars().one()
 
     async def create(
-        self, session: AsyncSession, obj_in: dict[str, Any]
+        self, session: AsyncSession, obj_in: dict[str, Any], flush=True
     ) -> ModelType:
         db_obj = self._model(**obj_in)
         session.add(db_obj)
-        await session.flush([db_obj])
+        if flush:
+            await session.flush([db_obj])
         return db_obj
 
     async def update(
@@ -70,10 +110,14 @@ class CRUDBase(Generic[ModelType]):
         is_patch=True,
         raise_on_not_affected=True,
     ) -> int:
+        if not filter_dict:
+            raise ValueError("filter_dict must not be empty")
         if is_patch:
             update_dict = {
                 k: v for k, v in update_dict.items() if v is not None
             }
+        if not update_dict:
+            raise ValueError("update_dict must not be empty")
         stmt = (
             update(self._model)
             .where(*self._generate_where_clause(filter_dict))
@@ -90,11 +134,12 @@ class CRUDBase(Generic[ModelType]):
         filter_dict: dict[str, Any],
         raise_on_not_affected=True,
     ) -> int:
+        if not filter_dict:
+            raise ValueError("filter_dict must not be empty")
         stmt = delete(self._model).where(
             *self._generate_where_clause(filter_dict)
         )
         result = await session.execute(stmt)
-        await session.flush()
         if raise_on_not_affected and not result.rowcount:
             raise NoResultFoundException()
         return result.rowcount
@@ -1,8 +1,8 @@
-import json
-from functools import wraps
+from functools import wraps, lru_cache
 from inspect import signature
 
 from fastapi import HTTPException
+from fastapi.encoders import jsonable_encoder
 from pydantic_core import ValidationError
 from sqlalchemy.exc import StatementError, InvalidRequestError
 
@@ -34,6 +34,7 @@ def db_exception_wrapper(*exception: type[DataBaseException]) -> ():
     return outer_wrapper
 
 
+@lru_cache(maxsize=None)
 def make_dependable(cls):
     """
     Pydantic BaseModels are very powerful because we get lots of validations and type checking right out of the box.
@@ -52,12 +53,20 @@ def make_dependable(cls):
     async def fetch(thing_request: ThingRequest = Depends(make_dependable(ThingRequest))):
     """
 
+    sig = signature(cls)
+    validate = cls.model_validate
+
     def init_cls_and_handle_errors(*args, **kwargs):
         try:
-            signature(init_cls_and_handle_errors).bind(*args, **kwargs)
-            return cls(*args, **kwargs)
+            sig.bind(*args, **kwargs)
+            return validate(kwargs)
         except ValidationError as e:
-            raise HTTPException(422, detail=json.loads(e.json()))
+            raise HTTPException(
+                422,
+                detail=jsonable_encoder(
+                    e.errors(include_url=False, include_context=False)
+                ),
+            )
 
-    init_cls_and_handle_errors.__signature__ = signature(cls)
+    init_cls_and_handle_errors.__signature__ = sig
     return init_cls_and_handle_errors
@@ -1,6 +1,7 @@
 from typing import Type, Optional, List, Literal
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
+from fastapi.responses import ORJSONResponse
 
 from fabric.cruds.base import CRUDBase
 from fabric.routes.defaults import (
@@ -37,53 +38,59 @@ def generate_default_router(
     tags: Optional[List[str]] = None,
     exclude_fields: Optional[List[str]] = None,
     allowed_methods: Optional[List[AllowedMethod]] = None,
+    default_response_class: Type[Response] = ORJSONResponse,
 ) -> APIRouter:
     exclude_fields = exclude_fields or ["id"]
-    request_schema = RequestSchema(model, exclude=exclude_fields)
-    response_schema = ResponseSchema(model)
-    patch_schema = PatchSchema(model, exclude=exclude_fields)
-    identity_schema = IdentitySchema(model)
     crud = crud_class(model)
 
-    route_map = {
-        "get_all": GetAllRoute(
+    # schema generation is memoized, so routes sharing a schema get the
+    # same class and only schemas of allowed routes are ever built
+    request_schema = lambda: RequestSchema(model, exclude=exclude_fields)
+    response_schema = lambda: ResponseSchema(model)
+    patch_schema = lambda: PatchSchema(model, exclude=exclude_fields)
+    identity_schema = lambda: IdentitySchema(model)
+
+    route_factories = {
+        "get_all": lambda: GetAllRoute(
             crud=crud,
-            response_schema=response_schema,
-            filter_schema=patch_schema,
+            response_schema=response_schema(),
+            filter_schema=patch_schema(),
         ),
-        "get_one": GetOneRoute(
+        "get_one": lambda: GetOneRoute(
             crud=crud,
-            response_schema=response_schema,
-            filter_schema=identity_schema,
+            response_schema=response_schema(),
+            filter_schema=identity_schema(),
         ),
-        "create": CreateRoute(
+        "create": lambda: CreateRoute(
             crud=crud,
-            request_schema=request_schema,
-            response_schema=response_schema,
+            request_schema=request_schema(),
+            response_schema=response_schema(),
         ),
-        "update": UpdateRoute(
+        "update": lambda: UpdateRoute(
             crud=crud,
-            request_schema=request_schema,
-            filter_schema=identity_schema,
+            request_schema=request_schema(),
+            filter_schema=identity_schema(),
         ),
-        "patch": PatchRoute(
+        "patch": lambda: PatchRoute(
             crud=crud,
-            request_schema=patch_schema,
-            filter_schema=identity_schema,
+            request_schema=patch_schema(),
+            filter_schema=identity_schema(),
         ),
-        "delete": DeleteRoute(
+        "delete": lambda: DeleteRoute(
             crud=crud,
-            filter_schema=identity_schema,
+            filter_schema=identity_schema(),
         ),
     }
 
-    all_methods = list(route_map.keys())
-    methods = allowed_methods if allowed_methods is not None else all_methods
-    routes = [route_map[m] for m in methods if m in route_map]
+    methods = dict.fromkeys(
+        allowed_methods if allowed_methods is not None else route_factories
+    )
+    routes = [route_factories[m]() for m in methods if m in route_factories]
 
     router = APIRouter(
         prefix=prefix or f"/{model.__name__.lower()}",
         tags=tags or [model.__name__.lower()],
+        default_response_class=default_response_class,
     )
     for route in routes:
         route.register(router, get_session)
@@ -1,6 +1,7 @@
 from typing import Callable, AsyncGenerator
 
 from fastapi import APIRouter
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from fabric.routes.base import RouteBase
@@ -11,6 +12,7 @@ def generate_router(
     get_session: Callable[[], AsyncGenerator[AsyncSession, None]],
     **router_kwargs
 ) -> APIRouter:
+    router_kwargs.setdefault("default_response_class", ORJSONResponse)
     router = APIRouter(**router_kwargs)
 
     for route in routes:
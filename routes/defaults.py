@@ -1,6 +1,7 @@
 from typing import List
 
 from fastapi import Depends, APIRouter
+from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from fabric.exc import (
@@ -11,6 +12,15 @@ from fabric.exc import (
 from .base import RouteBase, Method
 
 
+def _set_fields(model: BaseModel) -> dict:
+    values = model.__dict__
+    return {
+        k: v
+        for k in model.__pydantic_fields_set__
+        if (v := values[k]) is not None
+    }
+
+
 class GetAllRoute(RouteBase):
     method = Method.get_all
 
@@ -29,7 +39,7 @@ class GetAllRoute(RouteBase):
             filter_model: filter_schema = Depends(filter_schema),
             session: AsyncSession = Depends(get_session),
         ):
-            filter_dict = filter_model.model_dump(exclude_none=True)
+            filter_dict = _set_fields(filter_model)
             return await crud.get_multi(
                 session, filter_dict=filter_dict, offset=offset, limit=limit
             )
@@ -52,10 +62,8 @@ class GetOneRoute(RouteBase):
             identity_filter: filter_schema = Depends(filter_schema),
             session: AsyncSession = Depends(get_session),
         ):
-            filter_dict = identity_filter.model_dump(exclude_none=True)
-            result = await crud.get_one(session, filter_dict=filter_dict)
-            await session.commit()
-            return result
+            filter_dict = _set_fields(identity_filter)
+            return await crud.get_one(session, filter_dict=filter_dict)
 
 
 class CreateRoute(RouteBase):
@@ -73,7 +81,9 @@ class CreateRoute(RouteBase):
         ):
             obj = await crud.create(session, obj_in=payload.model_dump())
             await session.commit()
-            return response_schema.model_validate(obj)
+            return response_schema.model_construct(
+                **{f: getattr(obj, f) for f in response_schema.model_fields}
+            )
 
 
 class UpdateRoute(RouteBase):
@@ -91,7 +101,7 @@ class UpdateRoute(RouteBase):
             identity_filter: filter_schema = Depends(filter_schema),
             session: AsyncSession = Depends(get_session),
         ):
-            filter_dict = identity_filter.model_dump(exclude_none=True)
+            filter_dict = _set_fields(identity_filter)
             changes = payload.model_dump()
             affected = await crud.update(
                 session,
@@ -118,7 +128,7 @@ class PatchRoute(RouteBase):
             identity_filter: filter_schema = Depends(filter_schema),
             session: AsyncSession = Depends(get_session),
         ):
-            filter_dict = identity_filter.model_dump(exclude_none=True)
+            filter_dict = _set_fields(identity_filter)
             changes = payload.model_dump(exclude_none=True)
             if not changes:
                 raise IntegrityErrorException(
@@ -147,7 +157,7 @@ class DeleteRoute(RouteBase):
             identity_filter: filter_schema = Depends(filter_schema),
             session: AsyncSession = Depends(get_session),
         ):
-            filter_dict = identity_filter.model_dump(exclude_none=True)
+            filter_dict = _set_fields(identity_filter)
             affected = await crud.delete(session, filter_dict=filter_dict)
             await session.commit()
             return affected
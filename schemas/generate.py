@@ -1,10 +1,24 @@
-from typing import Type, Optional, Any, List, Dict
+from functools import lru_cache
+from typing import Type, Optional, Any, List, Dict, FrozenSet, Tuple
 
 from pydantic import BaseModel, ConfigDict, create_model
 from sqlalchemy.inspection import inspect
 from sqlalchemy.orm import DeclarativeBase
 from sqlalchemy.orm.properties import ColumnProperty
 
+_DEFAULT_CONFIG = ConfigDict(from_attributes=True)
+
+
+def _get_python_type(column) -> type:
+    column_type = column.type
+    if hasattr(column_type, "impl") and hasattr(
+        column_type.impl, "python_type"
+    ):
+        return column_type.impl.python_type
+    if hasattr(column_type, "python_type"):
+        return column_type.python_type
+    raise ValueError(f"Cannot determine python_type for column {column}")
+
 
 def generate_pydantic_schema_from_model(
     model: Type[DeclarativeBase],
@@ -17,7 +31,36 @@ def generate_pydantic_schema_from_model(
     only_unique: bool = False,
     make_all_optional: bool = False,
 ) -> Type[BaseModel]:
-    config = config or ConfigDict(from_attributes=True)
+    config_items = tuple((config or _DEFAULT_CONFIG).items())
+    key = (
+        model,
+        name or f"{model.__name__}Schema",
+        config_items,
+        frozenset(include) if include else None,
+        frozenset(exclude) if exclude else None,
+        only_primary_keys,
+        only_unique,
+        make_all_optional,
+    )
+    try:
+        hash(config_items)
+    except TypeError:
+        return _build_pydantic_schema.__wrapped__(*key)
+    return _build_pydantic_schema(*key)
+
+
+@lru_cache(maxsize=None)
+def _build_pydantic_schema(
+    model: Type[DeclarativeBase],
+    name: str,
+    config_items: Tuple[Tuple[str, Any], ...],
+    include: Optional[FrozenSet[str]],
+    exclude: Optional[FrozenSet[str]],
+    only_primary_keys: bool,
+    only_unique: bool,
+    make_all_optional: bool,
+) -> Type[BaseModel]:
+    config = ConfigDict(config_items)
     mapper = inspect(model)
     fields: Dict[str, Any] = {}
 
@@ -37,16 +80,7 @@ def generate_pydantic_schema_from_model(
         if only_unique and not getattr(column, "unique", False):
             continue
 
-        if hasattr(column.type, "impl") and hasattr(
-            column.type.impl, "python_type"
-        ):
-            python_type = column.type.impl.python_type
-        elif hasattr(column.type, "python_type"):
-            python_type = column.type.python_type
-        else:
-            raise ValueError(
-                f"Cannot determine python_type for column {column}"
-            )
+        python_type = _get_python_type(column)
 
         if column.nullable or make_all_optional:
             python_type = Optional[python_type]
@@ -63,5 +97,4 @@ def generate_pydantic_schema_from_model(
 
         fields[name_] = (python_type, default)
 
-    schema_name = name or f"{model.__name__}Schema"
-    return create_model(schema_name, __config__=config, **fields)
+    return create_model(name, __config__=config, **fields)
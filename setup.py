@@ -7,6 +7,7 @@ setup(
     install_requires=[
         "SQLAlchemy==2.0.41",
         "fastapi==0.115.14",
+        "orjson==3.10.18",
         "setuptools==80.9.0",
     ],
 )